@@ -10,15 +10,30 @@ Handles migration from Spring Boot 2.x to 3.x with:
 
 import os
 import re
+import errno
 import shutil
+import tempfile
 import json
 import logging
+import logging.handlers
 import argparse
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Optional, Iterator, NamedTuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
 
+try:
+    import xxhash
+except ImportError:  # optional, falls back to stdlib BLAKE2b
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
 # Configure logging
 LOG_DIR = Path("migration-logs")
 LOG_DIR.mkdir(exist_ok=True)
@@ -26,62 +41,183 @@ LOG_DIR.mkdir(exist_ok=True)
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 log_file = LOG_DIR / f"migration_{timestamp}.log"
 
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Records for the log file are buffered and written in batches; errors flush immediately
+file_handler = logging.FileHandler(log_file)
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+memory_handler = logging.handlers.MemoryHandler(capacity=1024, target=file_handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(log_file),
+        memory_handler,
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# Emit a progress line every N files instead of logging each file at INFO
+PROGRESS_INTERVAL = 100
+
+# Read size used when streaming files through the backup checksum
+COPY_CHUNK_SIZE = 64 * 1024
+
+# Backup manifest layout: v1 was a dict keyed by original path,
+# v2 is {"version": 2, "files": [record, ...]}
+MANIFEST_VERSION = 2
+
+# Directories never descended into when looking for Java sources
+SKIPPED_DIRS = frozenset({"test", "target"})
+
+# Backup checksums only detect changed files, so a fast non-cryptographic
+# hash is enough: xxh3 when available, otherwise a compact BLAKE2b digest
+CHECKSUM_ALG = 'xxh3_64' if xxhash else 'blake2b'
+
+def new_checksum(data: bytes = b''):
+    """Return an incremental hasher for backup checksums, seeded with data"""
+    if xxhash:
+        return xxhash.xxh3_64(data)
+    return hashlib.blake2b(data, digest_size=16)
+
+def copy_with_times(src: Path, dst: Path) -> None:
+    """Copy file contents and timestamps, skipping the rest of copy2's metadata"""
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def write_json(path: Path, obj) -> None:
+    """Serialize obj in memory and write it out with a single write call"""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            f.write(json.dumps(obj, indent=2))
+
+# Precompiled patterns shared by the migrator helpers. All patterns are bytes
+# and compiled with re.ASCII so \s and \w use the plain ASCII class tables.
+TYPE_ANNOTATION_RE = re.compile(rb'@Type\s*\(', re.ASCII)
+OLD_TYPE_IMPORT_RE = re.compile(rb'import\s+org\.hibernate\.annotations\.Type;\s*\n', re.ASCII)
+IMPORT_STATEMENT_RE = re.compile(rb'(import\s+[\w.]+;)', re.ASCII)
+REMAINING_JAVAX_RE = re.compile(rb'import\s+javax\.(persistence|validation|servlet|annotation)\.', re.ASCII)
+IMPORT_NAME_RE = re.compile(rb'import\s+([\w.]+);', re.ASCII)
+
+class FileMigrationResult(NamedTuple):
+    """Outcome of migrating one file, produced in worker processes"""
+    file_path: Path
+    modified: bool
+    content: Optional[bytes]
+    original_checksum: Optional[str]
+    stat_deltas: Dict[str, int]
+    errors: List[str]
+
 class MigrationBackup:
     """Handles backup and restoration of files"""
     
     def __init__(self, backup_dir: Path):
         self.backup_dir = backup_dir
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-        self.backup_manifest = {}
+        self.backup_manifest: List[Dict] = []
+        self._manifest_index: Optional[Dict[str, Dict]] = None
+        # Resolved once; backup paths are laid out relative to the working directory
+        self._cwd = Path.cwd()
+        # All files in one run share the migration timestamp
+        self._run_timestamp = datetime.now().isoformat()
         
+    def _prepare_backup_path(self, file_path: Path) -> Path:
+        """Map a file to its location in the backup tree, creating parent dirs"""
+        rel_path = file_path.relative_to(self._cwd)
+        backup_path = self.backup_dir / rel_path
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        return backup_path
+    
+    def _record_backup(self, file_path: Path, backup_path: Path, checksum: str) -> str:
+        """Add a manifest record for a backed-up file and return the backup path"""
+        backup_key = str(backup_path)
+        self.backup_manifest.append({
+            'original_path': str(file_path),
+            'backup_path': backup_key,
+            'original_checksum': checksum,
+            'checksum_alg': CHECKSUM_ALG,
+            'timestamp': self._run_timestamp
+        })
+        self._manifest_index = None
+        return backup_key
+    
     def backup_file(self, file_path: Path) -> Optional[str]:
         """Backup a file and return backup path"""
         try:
             # Create relative backup path
-            rel_path = file_path.relative_to(Path.cwd())
-            backup_path = self.backup_dir / rel_path
-            backup_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Calculate checksum
-            with open(file_path, 'rb') as f:
-                checksum = hashlib.md5(f.read()).hexdigest()
+            backup_path = self._prepare_backup_path(file_path)
             
-            # Copy file
-            shutil.copy2(file_path, backup_path)
+            # Copy file and calculate checksum in a single streamed pass
+            digest = new_checksum()
+            with open(file_path, 'rb') as src, open(backup_path, 'wb') as dst:
+                src_stat = os.fstat(src.fileno())
+                while True:
+                    chunk = src.read(COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    dst.write(chunk)
+            # Only timestamps matter for backups; skip copystat's mode/xattr syscalls
+            os.utime(backup_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
             
             # Store in manifest
-            self.backup_manifest[str(file_path)] = {
-                'backup_path': str(backup_path),
-                'original_checksum': checksum,
-                'timestamp': datetime.now().isoformat()
-            }
+            return self._record_backup(file_path, backup_path, digest.hexdigest())
             
-            return str(backup_path)
+        except Exception as e:
+            logger.error(f"Failed to backup {file_path}: {e}")
+            return None
+    
+    def move_file(self, file_path: Path, checksum: str) -> Optional[str]:
+        """Move a file into the backup tree and return backup path.
+        
+        The original is renamed rather than copied, so its bytes are never
+        rewritten; checksum must be the caller's digest of those bytes. Falls
+        back to backup_file when the backup directory is on another device.
+        """
+        try:
+            backup_path = self._prepare_backup_path(file_path)
+            os.rename(file_path, backup_path)
+            return self._record_backup(file_path, backup_path, checksum)
             
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                return self.backup_file(file_path)
+            logger.error(f"Failed to backup {file_path}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Failed to backup {file_path}: {e}")
             return None
     
+    def undo_move(self, file_path: Path, backup_path: str):
+        """Put back a file moved into the backup tree by move_file and forget its backup
+        
+        A copied backup (the cross-device fallback) is just deleted, since
+        the original never left file_path.
+        """
+        if file_path.exists():
+            os.remove(backup_path)
+        else:
+            os.replace(backup_path, file_path)
+        self.backup_manifest = [rec for rec in self.backup_manifest if rec['backup_path'] != backup_path]
+        self._manifest_index = None
+    
     def restore_file(self, file_path: Path) -> bool:
         """Restore a file from backup"""
         try:
-            if str(file_path) in self.backup_manifest:
-                backup_info = self.backup_manifest[str(file_path)]
+            if self._manifest_index is None:
+                self._manifest_index = {rec['original_path']: rec for rec in self.backup_manifest}
+            backup_info = self._manifest_index.get(str(file_path))
+            if backup_info:
                 backup_path = Path(backup_info['backup_path'])
                 
                 if backup_path.exists():
-                    shutil.copy2(backup_path, file_path)
+                    copy_with_times(backup_path, file_path)
                     logger.info(f"Restored {file_path} from backup")
                     return True
                     
@@ -95,15 +231,15 @@ class MigrationBackup:
     def save_manifest(self):
         """Save backup manifest to file"""
         manifest_path = self.backup_dir / "backup_manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(self.backup_manifest, f, indent=2)
+        write_json(manifest_path, {'version': MANIFEST_VERSION, 'files': self.backup_manifest})
 
 class SpringBoot3Migrator:
     """Main migration class"""
     
-    def __init__(self, project_root: Path, dry_run: bool = False):
+    def __init__(self, project_root: Path, dry_run: bool = False, jobs: Optional[int] = None):
         self.project_root = project_root
         self.dry_run = dry_run
+        self.jobs = jobs or os.cpu_count() or 1
         self.backup = MigrationBackup(Path(f"backups/migration_{timestamp}"))
         self.migration_stats = {
             'files_processed': 0,
@@ -115,40 +251,30 @@ class SpringBoot3Migrator:
             'errors': []
         }
         
-        # Migration patterns
-        self.javax_to_jakarta_patterns = [
-            (r'import\s+javax\.persistence\.', 'import jakarta.persistence.'),
-            (r'import\s+javax\.validation\.', 'import jakarta.validation.'),
-            (r'import\s+javax\.servlet\.', 'import jakarta.servlet.'),
-            (r'import\s+javax\.annotation\.', 'import jakarta.annotation.'),
-            (r'import\s+javax\.transaction\.', 'import jakarta.transaction.'),
-            (r'import\s+javax\.websocket\.', 'import jakarta.websocket.'),
-            (r'import\s+javax\.enterprise\.', 'import jakarta.enterprise.'),
-            (r'import\s+javax\.inject\.', 'import jakarta.inject.'),
-            (r'import\s+javax\.ws\.rs\.', 'import jakarta.ws.rs.'),
-        ]
+        # Migration patterns, compiled once up front. Each family is fused
+        # into a single alternation so every file is scanned once per family.
         
-        self.type_annotation_patterns = [
-            # @Type(type = "jsonb") -> @JdbcTypeCode(SqlTypes.JSON)
-            (r'@Type\s*\(\s*type\s*=\s*"jsonb"\s*\)', '@JdbcTypeCode(SqlTypes.JSON)'),
-            # Handle multiline @Type annotations
-            (r'@Type\s*\(\s*type\s*=\s*"jsonb"\s*\)\s*\n', '@JdbcTypeCode(SqlTypes.JSON)\n'),
-        ]
+        # import javax.<pkg>. -> import jakarta.<pkg>.
+        self.javax_to_jakarta_pattern = re.compile(
+            rb'import\s+javax\.(persistence|validation|servlet|annotation|transaction'
+            rb'|websocket|enterprise|inject|ws\.rs)\.',
+            re.ASCII,
+        )
+        self.javax_to_jakarta_replacement = rb'import jakarta.\1.'
         
-        self.type_class_patterns = [
-            # @Type(JsonType.class) -> @JdbcTypeCode(SqlTypes.JSON)
-            (r'@Type\s*\(\s*JsonType\.class\s*\)', '@JdbcTypeCode(SqlTypes.JSON)'),
-            # @Type(io.hypersistence.utils.hibernate.type.json.JsonType.class)
-            (r'@Type\s*\(\s*io\.hypersistence\.utils\.hibernate\.type\.json\.JsonType\.class\s*\)', 
-             '@JdbcTypeCode(SqlTypes.JSON)'),
-        ]
+        # @Type(type = "jsonb"), @Type(JsonType.class) and
+        # @Type(io.hypersistence.utils.hibernate.type.json.JsonType.class)
+        # -> @JdbcTypeCode(SqlTypes.JSON)
+        self.type_annotation_pattern = re.compile(
+            rb'@Type\s*\(\s*(?:type\s*=\s*"jsonb"'
+            rb'|(?:io\.hypersistence\.utils\.hibernate\.type\.json\.)?JsonType\.class)\s*\)',
+            re.ASCII,
+        )
+        self.type_annotation_replacement = b'@JdbcTypeCode(SqlTypes.JSON)'
         
-        self.security_patterns = [
-            # antMatchers -> requestMatchers
-            (r'\.antMatchers\s*\(', '.requestMatchers('),
-            # mvcMatchers -> requestMatchers
-            (r'\.mvcMatchers\s*\(', '.requestMatchers('),
-        ]
+        # antMatchers / mvcMatchers -> requestMatchers
+        self.security_pattern = re.compile(rb'\.(?:antMatchers|mvcMatchers)\s*\(', re.ASCII)
+        self.security_replacement = b'.requestMatchers('
     
     def find_java_files(self) -> List[Path]:
         """Find all Java files in the project"""
@@ -156,29 +282,36 @@ class SpringBoot3Migrator:
         services_dir = self.project_root / "services"
         
         if services_dir.exists():
-            for file_path in services_dir.rglob("*.java"):
-                # Skip test files and generated files
-                if "/test/" not in str(file_path) and "/target/" not in str(file_path):
-                    java_files.append(file_path)
+            java_files = list(self._walk_java_files(str(services_dir)))
                     
         logger.info(f"Found {len(java_files)} Java files to process")
         return java_files
     
-    def needs_hibernate_imports(self, content: str) -> bool:
+    def _walk_java_files(self, dir_path: str) -> Iterator[Path]:
+        """Yield Java sources under dir_path, pruning test and generated directories"""
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip test files and generated files
+                    if entry.name not in SKIPPED_DIRS:
+                        yield from self._walk_java_files(entry.path)
+                elif entry.name.endswith(".java"):
+                    yield Path(entry.path)
+    
+    def needs_hibernate_imports(self, content: bytes) -> bool:
         """Check if file needs Hibernate imports for @JdbcTypeCode"""
-        return any(pattern[0] in content for pattern in self.type_annotation_patterns + self.type_class_patterns)
+        return b'@JdbcTypeCode' in content
     
-    def add_hibernate_imports(self, content: str) -> str:
+    def add_hibernate_imports(self, content: bytes) -> bytes:
         """Add necessary Hibernate imports if not present"""
         if self.needs_hibernate_imports(content):
             # Check if imports already exist
-            has_jdbc_type_code = "import org.hibernate.annotations.JdbcTypeCode;" in content
-            has_sql_types = "import org.hibernate.type.SqlTypes;" in content
+            has_jdbc_type_code = b"import org.hibernate.annotations.JdbcTypeCode;" in content
+            has_sql_types = b"import org.hibernate.type.SqlTypes;" in content
             
             if not has_jdbc_type_code or not has_sql_types:
                 # Find the last import statement
-                import_pattern = r'(import\s+[\w\.]+;)'
-                imports = list(re.finditer(import_pattern, content))
+                imports = list(IMPORT_STATEMENT_RE.finditer(content))
                 
                 if imports:
                     last_import = imports[-1]
@@ -186,111 +319,168 @@ class SpringBoot3Migrator:
                     
                     new_imports = []
                     if not has_jdbc_type_code:
-                        new_imports.append("import org.hibernate.annotations.JdbcTypeCode;")
+                        new_imports.append(b"import org.hibernate.annotations.JdbcTypeCode;")
                     if not has_sql_types:
-                        new_imports.append("import org.hibernate.type.SqlTypes;")
+                        new_imports.append(b"import org.hibernate.type.SqlTypes;")
                     
                     if new_imports:
-                        import_text = "\n" + "\n".join(new_imports)
+                        import_text = b"\n" + b"\n".join(new_imports)
                         content = content[:insert_pos] + import_text + content[insert_pos:]
                         
         return content
     
-    def remove_old_type_import(self, content: str) -> str:
+    def remove_old_type_import(self, content: bytes) -> bytes:
         """Remove old @Type import if no longer needed"""
         # Check if @Type is still used after migration
-        if not re.search(r'@Type\s*\(', content):
+        if not TYPE_ANNOTATION_RE.search(content):
             # Remove the import
-            content = re.sub(r'import\s+org\.hibernate\.annotations\.Type;\s*\n', '', content)
+            content = OLD_TYPE_IMPORT_RE.sub(b'', content)
             
         return content
     
-    def migrate_file(self, file_path: Path) -> Tuple[bool, List[str]]:
-        """Migrate a single file"""
-        logger.info(f"Processing: {file_path}")
-        errors = []
-        modified = False
+    def migrate_file(self, file_path: Path) -> FileMigrationResult:
+        """Compute the migrated content of a single file.
+        
+        Does not touch the backup or the migration statistics so it can run in
+        a worker process. For modified files the result carries the new content
+        and a checksum of the original bytes for the backup manifest.
+        """
+        logger.debug("Processing: %s", file_path)
+        stat_deltas = {
+            'javax_imports_fixed': 0,
+            'type_annotations_fixed': 0,
+            'security_configs_fixed': 0,
+        }
         
         try:
             # Read file
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'rb') as f:
                 original_content = f.read()
             
             content = original_content
             
+            # Each pattern family is only run when its literal anchor is present;
+            # the substring check is far cheaper than a regex scan that cannot match
+            
             # Apply javax to jakarta migrations
-            for pattern, replacement in self.javax_to_jakarta_patterns:
-                new_content = re.sub(pattern, replacement, content)
-                if new_content != content:
-                    self.migration_stats['javax_imports_fixed'] += len(re.findall(pattern, content))
-                    content = new_content
-                    modified = True
+            if b'javax.' in content:
+                content, count = self.javax_to_jakarta_pattern.subn(self.javax_to_jakarta_replacement, content)
+                stat_deltas['javax_imports_fixed'] += count
             
             # Apply @Type to @JdbcTypeCode migrations
-            for pattern, replacement in self.type_annotation_patterns + self.type_class_patterns:
-                new_content = re.sub(pattern, replacement, content)
-                if new_content != content:
-                    self.migration_stats['type_annotations_fixed'] += len(re.findall(pattern, content))
-                    content = new_content
-                    modified = True
+            if b'@Type' in content:
+                content, count = self.type_annotation_pattern.subn(self.type_annotation_replacement, content)
+                stat_deltas['type_annotations_fixed'] += count
             
-            # Add Hibernate imports if needed
-            if modified and self.needs_hibernate_imports(content):
+            # Add Hibernate imports if any @Type annotation was just rewritten
+            if stat_deltas['type_annotations_fixed']:
                 content = self.add_hibernate_imports(content)
                 content = self.remove_old_type_import(content)
             
             # Apply Spring Security migrations
-            for pattern, replacement in self.security_patterns:
-                new_content = re.sub(pattern, replacement, content)
-                if new_content != content:
-                    self.migration_stats['security_configs_fixed'] += len(re.findall(pattern, content))
-                    content = new_content
-                    modified = True
+            if b'Matchers' in content:
+                content, count = self.security_pattern.subn(self.security_replacement, content)
+                stat_deltas['security_configs_fixed'] += count
             
-            # Write changes if modified
-            if modified and not self.dry_run:
-                # Backup original file
-                if self.backup.backup_file(file_path):
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                    logger.info(f"Successfully migrated: {file_path}")
-                else:
-                    errors.append(f"Failed to backup file: {file_path}")
-                    modified = False
+            # Only report a change when the bytes actually differ, so re-runs over
+            # already migrated sources never trigger a rewrite
+            if content == original_content:
+                return FileMigrationResult(file_path, False, None, None, stat_deltas, [])
             
-            return modified, errors
+            checksum = new_checksum(original_content).hexdigest()
+            return FileMigrationResult(file_path, True, content, checksum, stat_deltas, [])
             
         except Exception as e:
             error_msg = f"Error processing {file_path}: {str(e)}"
             logger.error(error_msg)
-            errors.append(error_msg)
-            return False, errors
+            return FileMigrationResult(file_path, False, None, None, stat_deltas, [error_msg])
     
-    def validate_migration(self, file_path: Path) -> List[str]:
-        """Validate migrated file for potential issues"""
-        issues = []
+    def write_migrated_file(self, file_path: Path, content: bytes, original_checksum: str) -> List[str]:
+        """Backup the original file and publish the migrated content.
+        
+        The new content goes to a temp file in the same directory first, the
+        original is moved into the backup tree, then the temp file replaces
+        it, so the source path never holds a half-written file. If the final
+        rename fails the original is moved back; a crash between the two
+        renames leaves it only in the backup tree.
+        """
+        tmp_path = None
+        backup_path = None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with tempfile.NamedTemporaryFile(dir=file_path.parent, prefix=f".{file_path.name}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = Path(f.name)
+                f.write(content)
+            shutil.copymode(file_path, tmp_path)
             
-            # Check for remaining javax imports
-            javax_pattern = r'import\s+javax\.(persistence|validation|servlet|annotation)\.'
-            if re.search(javax_pattern, content):
-                issues.append(f"File still contains javax imports: {file_path}")
+            backup_path = self.backup.move_file(file_path, original_checksum)
+            if not backup_path:
+                os.remove(tmp_path)
+                return [f"Failed to backup file: {file_path}"]
             
-            # Check for remaining @Type annotations
-            if re.search(r'@Type\s*\(', content):
-                issues.append(f"File still contains @Type annotations: {file_path}")
+            os.replace(tmp_path, file_path)
+            logger.debug("Successfully migrated: %s", file_path)
+            return []
+        except Exception as e:
+            error_msg = f"Error writing {file_path}: {str(e)}"
+            if backup_path:
+                try:
+                    self.backup.undo_move(file_path, backup_path)
+                except OSError as undo_error:
+                    error_msg += f" (original left at {backup_path}: {undo_error})"
+            logger.error(error_msg)
+            if tmp_path and tmp_path.exists():
+                os.remove(tmp_path)
+            return [error_msg]
+    
+    def iter_migrated_files(self, java_files: List[Path]) -> Iterator[FileMigrationResult]:
+        """Run migrate_file over all files, fanning out to worker processes when jobs != 1"""
+        if self.jobs == 1 or len(java_files) <= 1:
+            yield from map(self.migrate_file, java_files)
+            return
+        
+        # Forked workers inherit the log buffer; write it out first so the
+        # parent's records are not duplicated when a worker flushes its copy
+        memory_handler.flush()
+        with ProcessPoolExecutor(max_workers=self.jobs,
+                                 initializer=_init_migration_worker,
+                                 initargs=(self,)) as executor:
+            yield from executor.map(_migrate_file_worker, java_files, chunksize=16)
+    
+    def validate_migration(self, file_path: Path, content: Optional[bytes] = None) -> List[str]:
+        """Validate migrated file for potential issues
+        
+        Pass the migrated content when it is already in memory to avoid
+        re-reading the file from disk.
+        """
+        try:
+            if content is not None:
+                return self._check_migrated_content(file_path, content)
             
-            # Check for duplicate imports
-            imports = re.findall(r'import\s+([\w\.]+);', content)
-            duplicates = [imp for imp in imports if imports.count(imp) > 1]
-            if duplicates:
-                issues.append(f"File contains duplicate imports: {set(duplicates)}")
+            with open(file_path, 'rb') as f:
+                return self._check_migrated_content(file_path, f.read())
                 
         except Exception as e:
-            issues.append(f"Validation error for {file_path}: {str(e)}")
+            return [f"Validation error for {file_path}: {str(e)}"]
+    
+    def _check_migrated_content(self, file_path: Path, content) -> List[str]:
+        """Run the validation patterns over a bytes-like buffer"""
+        issues = []
+        
+        # Check for remaining javax imports
+        if REMAINING_JAVAX_RE.search(content):
+            issues.append(f"File still contains javax imports: {file_path}")
+        
+        # Check for remaining @Type annotations
+        if TYPE_ANNOTATION_RE.search(content):
+            issues.append(f"File still contains @Type annotations: {file_path}")
+        
+        # Check for duplicate imports
+        imports = IMPORT_NAME_RE.findall(content)
+        duplicates = {imp.decode('utf-8') for imp, count in Counter(imports).items() if count > 1}
+        if duplicates:
+            issues.append(f"File contains duplicate imports: {duplicates}")
             
         return issues
     
@@ -302,21 +492,29 @@ class SpringBoot3Migrator:
         # Find all Java files
         java_files = self.find_java_files()
         
-        # Process each file
-        for file_path in java_files:
+        # Process each file; regex work runs in parallel, backup and writes stay serial
+        for file_path, modified, content, checksum, stat_deltas, errors in self.iter_migrated_files(java_files):
             self.migration_stats['files_processed'] += 1
+            if self.migration_stats['files_processed'] % PROGRESS_INTERVAL == 0:
+                logger.info("Processed %d/%d files", self.migration_stats['files_processed'], len(java_files))
+            for stat, delta in stat_deltas.items():
+                self.migration_stats[stat] += delta
             
-            modified, errors = self.migrate_file(file_path)
+            if modified and not self.dry_run:
+                write_errors = self.write_migrated_file(file_path, content, checksum)
+                if write_errors:
+                    errors = errors + write_errors
+                    modified = False
             
             if modified:
                 self.migration_stats['files_modified'] += 1
                 
                 # Validate the migration
                 if not self.dry_run:
-                    issues = self.validate_migration(file_path)
+                    issues = self.validate_migration(file_path, content)
                     if issues:
                         self.migration_stats['errors'].extend(issues)
-                        logger.warning(f"Validation issues for {file_path}: {issues}")
+                        logger.warning("Validation issues for %s: %s", file_path, issues)
             
             if errors:
                 self.migration_stats['files_failed'] += 1
@@ -343,8 +541,7 @@ class SpringBoot3Migrator:
             'backup_location': str(self.backup.backup_dir) if not self.dry_run else None
         }
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json(report_path, report)
         
         logger.info(f"\nMigration Report:")
         logger.info(f"  Files processed: {self.migration_stats['files_processed']}")
@@ -361,11 +558,25 @@ class SpringBoot3Migrator:
         
         logger.info(f"\nFull report saved to: {report_path}")
 
+# Worker-process state for parallel migration; set once per worker by the pool initializer
+_worker_migrator: Optional[SpringBoot3Migrator] = None
+
+def _init_migration_worker(migrator: SpringBoot3Migrator):
+    global _worker_migrator
+    _worker_migrator = migrator
+    # Records the parent buffered after the pool started belong to the parent
+    memory_handler.buffer.clear()
+
+def _migrate_file_worker(file_path: Path) -> FileMigrationResult:
+    return _worker_migrator.migrate_file(file_path)
+
 def main():
     parser = argparse.ArgumentParser(description='Migrate Waqiti application to Spring Boot 3.x')
     parser.add_argument('--dry-run', action='store_true', help='Run without making changes')
     parser.add_argument('--project-root', type=str, default='.', help='Project root directory')
     parser.add_argument('--rollback', type=str, help='Rollback using backup directory')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of worker processes (default: CPU count, 1 = sequential)')
     
     args = parser.parse_args()
     
@@ -377,7 +588,7 @@ def main():
         return
     
     # Run migration
-    migrator = SpringBoot3Migrator(project_root, dry_run=args.dry_run)
+    migrator = SpringBoot3Migrator(project_root, dry_run=args.dry_run, jobs=args.jobs)
     stats = migrator.run_migration()
     
     # Exit with error code if failures occurred
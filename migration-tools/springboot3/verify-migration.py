@@ -6,12 +6,22 @@ Checks for remaining issues and generates a detailed report
 
 import os
 import re
+import mmap
+import bisect
 import json
 import logging
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Iterator, Optional
+from itertools import islice
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -20,11 +30,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON, using orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# One reported problem; converted to a dict only when the JSON report is written
+Issue = namedtuple('Issue', 'file line issue type')
+
+# Issue type -> report category; anything else lands in 'other_issues'
+TYPE_TO_KEY = {
+    'javax_import': 'javax_imports',
+    'type_annotation': 'type_annotations',
+    'security_deprecation': 'security_deprecations',
+    'duplicate_import': 'duplicate_imports',
+    'missing_import': 'missing_imports',
+}
+
+# Files above this size are scanned through mmap rather than read()
+MMAP_THRESHOLD = 256 * 1024
+
+# Directories never descended into when looking for Java sources
+SKIPPED_DIRS = frozenset({"test", "target"})
+
+# Single pass over each file: every construct the checks care about is one
+# branch of this alternation, dispatched on the named group that matched.
+#   import     - any import statement; javax packages and duplicates are
+#                classified from the imported name
+#   type       - @Type annotations that should be @JdbcTypeCode(SqlTypes.JSON)
+#   deprecated - deprecated Spring Security methods
+COMBINED_RE = re.compile(
+    rb'(?P<import>import\s+(?P<imported>[\w.]+)(?P<terminator>;)?)'
+    rb'|(?P<type>@Type\s*\(\s*(?:type\s*=\s*"jsonb"'
+    rb'|(?:io\.hypersistence\.utils\.hibernate\.type\.json\.)?JsonType\.class)\s*\))'
+    rb'|(?P<deprecated>\.(?:antMatchers|mvcMatchers)\s*\(|\.authorizeRequests\s*\(\s*\))'
+)
+
+# Literals at least one of which must be present for COMBINED_RE to find
+# anything other than plain import statements. Content may be an mmap, whose
+# ``in`` does not do substring search, so these are probed with find().
+REPORTABLE_LITERALS = (b'javax.', b'@Type', b'Matchers', b'.authorizeRequests')
+
+# Import statements only; used for the duplicate check on files that
+# contain none of the reportable literals
+IMPORT_RE = re.compile(rb'import\s+([\w.]+);')
+
+NEWLINE_RE = re.compile(rb'\n')
+
+# javax packages that should be migrated to jakarta
+JAVAX_PACKAGE_RE = re.compile(
+    rb'javax\.(persistence|validation|servlet|annotation|transaction|websocket|enterprise|inject|ws\.rs)\.'
+)
+
 class MigrationVerifier:
     """Verifies the migration was successful"""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, jobs: Optional[int] = None):
         self.project_root = project_root
+        self.jobs = jobs or os.cpu_count() or 1
         self.issues = {
             'javax_imports': [],
             'type_annotations': [],
@@ -39,6 +103,17 @@ class MigrationVerifier:
             'files_with_issues': 0,
             'total_issues': 0
         }
+        # COMBINED_RE group name -> check for that kind of match
+        self.match_checks = {
+            'import': self.check_import,
+            'type': self.check_type_annotation,
+            'deprecated': self.check_security_deprecation,
+        }
+    
+    @staticmethod
+    def line_number(newlines: List[int], pos: int) -> int:
+        """1-based line number of a position, given the file's newline offsets"""
+        return bisect.bisect_right(newlines, pos) + 1
     
     def find_java_files(self) -> List[Path]:
         """Find all Java files in the project"""
@@ -46,162 +121,157 @@ class MigrationVerifier:
         services_dir = self.project_root / "services"
         
         if services_dir.exists():
-            for file_path in services_dir.rglob("*.java"):
-                if "/test/" not in str(file_path) and "/target/" not in str(file_path):
-                    java_files.append(file_path)
+            for root, dirs, files in os.walk(services_dir):
+                # Prune test and build output trees before descending into them
+                dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
+                java_files.extend(Path(root, name) for name in files if name.endswith(".java"))
                     
         return java_files
     
-    def check_javax_imports(self, file_path: Path, content: str) -> List[Dict]:
-        """Check for remaining javax imports that should be jakarta"""
-        issues = []
-        
-        # Patterns for javax imports that should be migrated
-        javax_patterns = [
-            (r'import\s+javax\.persistence\.', 'jakarta.persistence'),
-            (r'import\s+javax\.validation\.', 'jakarta.validation'),
-            (r'import\s+javax\.servlet\.', 'jakarta.servlet'),
-            (r'import\s+javax\.annotation\.', 'jakarta.annotation'),
-            (r'import\s+javax\.transaction\.', 'jakarta.transaction'),
-            (r'import\s+javax\.websocket\.', 'jakarta.websocket'),
-            (r'import\s+javax\.enterprise\.', 'jakarta.enterprise'),
-            (r'import\s+javax\.inject\.', 'jakarta.inject'),
-            (r'import\s+javax\.ws\.rs\.', 'jakarta.ws.rs'),
-        ]
-        
-        for pattern, replacement in javax_patterns:
-            matches = list(re.finditer(pattern, content))
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                issues.append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'issue': f"Found {match.group()} - should be {replacement}",
-                    'type': 'javax_import'
-                })
+    def check_import(self, file_str: str, match: re.Match, newlines: List[int],
+                     issues: List[Issue], imports: List[bytes]):
+        """Check an import statement for a remaining javax package"""
+        imported = match.group('imported')
+        if match.group('terminator'):
+            imports.append(imported)
         
-        return issues
+        javax_match = JAVAX_PACKAGE_RE.match(imported)
+        if javax_match:
+            found = match.string[match.start():match.start('imported') + javax_match.end()]
+            issues.append(Issue(
+                file=file_str,
+                line=self.line_number(newlines, match.start()),
+                issue=f"Found {found.decode('utf-8', 'replace')} - should be jakarta.{javax_match.group(1).decode()}",
+                type='javax_import'
+            ))
     
-    def check_type_annotations(self, file_path: Path, content: str) -> List[Dict]:
-        """Check for remaining @Type annotations"""
-        issues = []
-        
-        # Patterns for @Type annotations
-        type_patterns = [
-            r'@Type\s*\(\s*type\s*=\s*"jsonb"\s*\)',
-            r'@Type\s*\(\s*JsonType\.class\s*\)',
-            r'@Type\s*\(\s*io\.hypersistence\.utils\.hibernate\.type\.json\.JsonType\.class\s*\)',
-        ]
-        
-        for pattern in type_patterns:
-            matches = list(re.finditer(pattern, content))
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                issues.append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'issue': f"Found {match.group()} - should be @JdbcTypeCode(SqlTypes.JSON)",
-                    'type': 'type_annotation'
-                })
-        
-        return issues
+    def check_type_annotation(self, file_str: str, match: re.Match, newlines: List[int],
+                              issues: List[Issue], imports: List[bytes]):
+        """Report a remaining @Type annotation"""
+        issues.append(Issue(
+            file=file_str,
+            line=self.line_number(newlines, match.start()),
+            issue=f"Found {match.group().decode('utf-8', 'replace')} - should be @JdbcTypeCode(SqlTypes.JSON)",
+            type='type_annotation'
+        ))
     
-    def check_security_deprecations(self, file_path: Path, content: str) -> List[Dict]:
-        """Check for deprecated Spring Security methods"""
-        issues = []
-        
-        # Patterns for deprecated methods
-        deprecated_patterns = [
-            (r'\.antMatchers\s*\(', '.requestMatchers('),
-            (r'\.mvcMatchers\s*\(', '.requestMatchers('),
-            (r'\.authorizeRequests\s*\(\s*\)', '.authorizeHttpRequests()'),
-        ]
-        
-        for pattern, replacement in deprecated_patterns:
-            matches = list(re.finditer(pattern, content))
-            for match in matches:
-                line_num = content[:match.start()].count('\n') + 1
-                issues.append({
-                    'file': str(file_path),
-                    'line': line_num,
-                    'issue': f"Found {match.group()} - should be {replacement}",
-                    'type': 'security_deprecation'
-                })
-        
-        return issues
+    def check_security_deprecation(self, file_str: str, match: re.Match, newlines: List[int],
+                                   issues: List[Issue], imports: List[bytes]):
+        """Report a deprecated Spring Security method"""
+        found = match.group()
+        replacement = '.authorizeHttpRequests()' if found.startswith(b'.authorizeRequests') else '.requestMatchers('
+        issues.append(Issue(
+            file=file_str,
+            line=self.line_number(newlines, match.start()),
+            issue=f"Found {found.decode('utf-8', 'replace')} - should be {replacement}",
+            type='security_deprecation'
+        ))
     
-    def check_duplicate_imports(self, file_path: Path, content: str) -> List[Dict]:
+    def check_duplicate_imports(self, file_str: str, imports: List[bytes]) -> List[Issue]:
         """Check for duplicate import statements"""
         issues = []
         
-        imports = re.findall(r'import\s+([\w\.]+);', content)
-        seen = set()
-        duplicates = set()
+        # Fast path: building a set is a single C-level pass, and almost
+        # every file has no duplicates
+        if len(set(imports)) == len(imports):
+            return issues
         
-        for imp in imports:
-            if imp in seen:
-                duplicates.add(imp)
-            seen.add(imp)
+        duplicates = [imp for imp, count in Counter(imports).items() if count > 1]
         
         if duplicates:
-            issues.append({
-                'file': str(file_path),
-                'line': 0,
-                'issue': f"Duplicate imports found: {', '.join(duplicates)}",
-                'type': 'duplicate_import'
-            })
+            issues.append(Issue(
+                file=file_str,
+                line=0,
+                issue=f"Duplicate imports found: {b', '.join(duplicates).decode('utf-8', 'replace')}",
+                type='duplicate_import'
+            ))
         
         return issues
     
-    def check_missing_imports(self, file_path: Path, content: str) -> List[Dict]:
-        """Check for missing imports after migration"""
+    def check_missing_imports(self, file_str: str, content) -> List[Issue]:
+        """Check for missing imports after migration; content is bytes or an mmap"""
         issues = []
+        uses_jdbc_type_code = content.find(b'@JdbcTypeCode') != -1
+        uses_sql_types_json = content.find(b'SqlTypes.JSON') != -1
+        
+        if not uses_jdbc_type_code and not uses_sql_types_json:
+            return issues
         
         # Check if @JdbcTypeCode is used but not imported
-        if '@JdbcTypeCode' in content and 'import org.hibernate.annotations.JdbcTypeCode;' not in content:
-            issues.append({
-                'file': str(file_path),
-                'line': 0,
-                'issue': "Missing import: org.hibernate.annotations.JdbcTypeCode",
-                'type': 'missing_import'
-            })
+        if uses_jdbc_type_code and content.find(b'import org.hibernate.annotations.JdbcTypeCode;') == -1:
+            issues.append(Issue(
+                file=file_str,
+                line=0,
+                issue="Missing import: org.hibernate.annotations.JdbcTypeCode",
+                type='missing_import'
+            ))
         
         # Check if SqlTypes is used but not imported
-        if 'SqlTypes.JSON' in content and 'import org.hibernate.type.SqlTypes;' not in content:
-            issues.append({
-                'file': str(file_path),
-                'line': 0,
-                'issue': "Missing import: org.hibernate.type.SqlTypes",
-                'type': 'missing_import'
-            })
+        if uses_sql_types_json and content.find(b'import org.hibernate.type.SqlTypes;') == -1:
+            issues.append(Issue(
+                file=file_str,
+                line=0,
+                issue="Missing import: org.hibernate.type.SqlTypes",
+                type='missing_import'
+            ))
         
         return issues
     
-    def check_file(self, file_path: Path) -> List[Dict]:
-        """Check a single file for migration issues"""
-        all_issues = []
+    def check_file(self, file_path: Path) -> List[Issue]:
+        """Check a single file for migration issues
+        
+        Large files are scanned through a read-only mmap instead of being
+        copied into memory.
+        """
+        file_str = str(file_path)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Run all checks
-            all_issues.extend(self.check_javax_imports(file_path, content))
-            all_issues.extend(self.check_type_annotations(file_path, content))
-            all_issues.extend(self.check_security_deprecations(file_path, content))
-            all_issues.extend(self.check_duplicate_imports(file_path, content))
-            all_issues.extend(self.check_missing_imports(file_path, content))
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        return self._check_content(file_str, mapped)
+                return self._check_content(file_str, f.read())
             
         except Exception as e:
-            all_issues.append({
-                'file': str(file_path),
-                'line': 0,
-                'issue': f"Error reading file: {str(e)}",
-                'type': 'file_error'
-            })
+            return [Issue(
+                file=file_str,
+                line=0,
+                issue=f"Error reading file: {str(e)}",
+                type='file_error'
+            )]
+    
+    def _check_content(self, file_str: str, content) -> List[Issue]:
+        """Run every check over a bytes-like buffer"""
+        all_issues = []
+        
+        if any(content.find(literal) != -1 for literal in REPORTABLE_LITERALS):
+            # Newline offsets let each issue find its line with a binary search
+            newlines = [m.start() for m in NEWLINE_RE.finditer(content)]
+            
+            # Run the pattern checks in a single pass over the content
+            imports = []
+            for match in COMBINED_RE.finditer(content):
+                self.match_checks[match.lastgroup](file_str, match, newlines, all_issues, imports)
+        else:
+            # Nothing reportable can match; only collect imports for the duplicate check
+            imports = IMPORT_RE.findall(content)
+        
+        all_issues.extend(self.check_duplicate_imports(file_str, imports))
+        all_issues.extend(self.check_missing_imports(file_str, content))
         
         return all_issues
     
+    def iter_file_issues(self, java_files: List[Path]) -> Iterator[List[Issue]]:
+        """Run check_file over all files, fanning out to worker processes when jobs != 1"""
+        if self.jobs == 1 or len(java_files) <= 1:
+            yield from map(self.check_file, java_files)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.jobs,
+                                 initializer=_init_verification_worker,
+                                 initargs=(self,)) as executor:
+            yield from executor.map(_check_file_worker, java_files, chunksize=64)
+    
     def verify_migration(self) -> Dict:
         """Run verification on all Java files"""
         logger.info(f"Starting migration verification...")
@@ -211,31 +281,17 @@ class MigrationVerifier:
         java_files = self.find_java_files()
         logger.info(f"Found {len(java_files)} Java files to verify")
         
-        # Check each file
-        for file_path in java_files:
+        # Check each file; scanning runs in worker processes, categorizing stays here
+        for issues in self.iter_file_issues(java_files):
             self.stats['files_checked'] += 1
             
-            issues = self.check_file(file_path)
-            
             if issues:
                 self.stats['files_with_issues'] += 1
                 self.stats['total_issues'] += len(issues)
                 
                 # Categorize issues
                 for issue in issues:
-                    issue_type = issue['type']
-                    if issue_type == 'javax_import':
-                        self.issues['javax_imports'].append(issue)
-                    elif issue_type == 'type_annotation':
-                        self.issues['type_annotations'].append(issue)
-                    elif issue_type == 'security_deprecation':
-                        self.issues['security_deprecations'].append(issue)
-                    elif issue_type == 'duplicate_import':
-                        self.issues['duplicate_imports'].append(issue)
-                    elif issue_type == 'missing_import':
-                        self.issues['missing_imports'].append(issue)
-                    else:
-                        self.issues['other_issues'].append(issue)
+                    self.issues[TYPE_TO_KEY.get(issue.type, 'other_issues')].append(issue)
         
         # Generate report
         self.generate_report()
@@ -245,6 +301,26 @@ class MigrationVerifier:
             'issues': self.issues
         }
     
+    def write_report(self, report_path: Path, report: Dict):
+        """Write the summary report followed by the detailed issues.
+        
+        Issues are serialized one at a time, category by category, so the
+        full issue list is never duplicated as dicts in memory.
+        """
+        with open(report_path, 'wb') as f:
+            # Summary fields, with the closing brace dropped so the detailed
+            # issues can be appended to the same object
+            f.write(json_bytes(report, indent=True)[:-2])
+            f.write(b',\n  "detailed_issues": {')
+            for index, (issue_type, issues) in enumerate(self.issues.items()):
+                f.write(b',\n    ' if index else b'\n    ')
+                f.write(json_bytes(issue_type) + b': [')
+                for issue_index, issue in enumerate(issues):
+                    f.write(b',\n      ' if issue_index else b'\n      ')
+                    f.write(json_bytes(issue._asdict()))
+                f.write(b'\n    ]' if issues else b']')
+            f.write(b'\n  }\n}\n')
+    
     def generate_report(self):
         """Generate verification report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -262,12 +338,10 @@ class MigrationVerifier:
                 'duplicate_imports': len(self.issues['duplicate_imports']),
                 'missing_imports': len(self.issues['missing_imports']),
                 'other_issues': len(self.issues['other_issues'])
-            },
-            'detailed_issues': self.issues
+            }
         }
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        self.write_report(report_path, report)
         
         # Print summary
         logger.info(f"\nVerification Report:")
@@ -283,28 +357,39 @@ class MigrationVerifier:
             
             # Show sample issues
             logger.warning(f"\nSample issues:")
-            sample_count = 0
-            for issue_type, issues in self.issues.items():
-                if issues and sample_count < 10:
-                    for issue in issues[:2]:  # Show 2 samples per type
-                        logger.warning(f"  [{issue_type}] {issue['file']}:{issue['line']} - {issue['issue']}")
-                        sample_count += 1
-                        if sample_count >= 10:
-                            break
+            samples = (
+                (issue_type, issue)
+                for issue_type, issues in self.issues.items()
+                for issue in issues[:2]  # Show 2 samples per type
+            )
+            for issue_type, issue in islice(samples, 10):
+                logger.warning(f"  [{issue_type}] {issue.file}:{issue.line} - {issue.issue}")
         
         logger.info(f"\nFull report saved to: {report_path}")
 
+# Worker-process state for parallel verification; set once per worker by the pool initializer
+_worker_verifier: Optional[MigrationVerifier] = None
+
+def _init_verification_worker(verifier: MigrationVerifier):
+    global _worker_verifier
+    _worker_verifier = verifier
+
+def _check_file_worker(file_path: Path) -> List[Issue]:
+    return _worker_verifier.check_file(file_path)
+
 def main():
     parser = argparse.ArgumentParser(description='Verify Spring Boot 3.x migration')
     parser.add_argument('--project-root', type=str, default='.', help='Project root directory')
     parser.add_argument('--fix-issues', action='store_true', help='Attempt to fix found issues')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of worker processes (default: CPU count, 1 = sequential)')
     
     args = parser.parse_args()
     
     project_root = Path(args.project_root).resolve()
     
     # Run verification
-    verifier = MigrationVerifier(project_root)
+    verifier = MigrationVerifier(project_root, jobs=args.jobs)
     results = verifier.verify_migration()
     
     # Exit with error code if issues found
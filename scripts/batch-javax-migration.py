@@ -6,68 +6,96 @@ Critical fix for production compilation issues
 
 import os
 import re
-import subprocess
 import sys
+import shutil
+import tempfile
 from pathlib import Path
+from typing import Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+# javax packages moved to the jakarta namespace
+JAVAX_PACKAGES = [
+    'persistence', 'validation', 'servlet', 'transaction', 'annotation',
+    'inject', 'enterprise', 'interceptor', 'decorator', 'security',
+    'ws.rs', 'xml.bind', 'jms', 'mail', 'json', 'jsonb', 'faces',
+    'websocket', 'ejb', 'batch',
+]
+
+_PACKAGE_ALTERNATION = '|'.join(re.escape(pkg) for pkg in JAVAX_PACKAGES).encode()
+
+# Import statements, static or not, of any migrated javax package
+IMPORT_PATTERN = re.compile(rb'(import (?:static )?)javax\.(' + _PACKAGE_ALTERNATION + rb')')
+IMPORT_REPLACEMENT = rb'\1jakarta.\2'
+
+def find_java_files(root: str = '.'):
+    """Yield every Java file under root"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        if '.git' in dirnames:
+            dirnames.remove('.git')
+        for name in filenames:
+            if name.endswith('.java'):
+                yield os.path.join(dirpath, name)
+
+def write_atomically(path: str, content: bytes):
+    """Replace path with content via a temp file in the same directory,
+    so an interrupted write never leaves a truncated source file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.javax-migration-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def migrate_file(path: str) -> Tuple[int, bool]:
+    """Rewrite javax imports in one file.
+    
+    Returns the number of imports changed and whether any javax import
+    remains afterwards, so verification needs no second pass over the tree.
+    """
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        
+        if b'javax.' not in content:
+            return 0, False
+        
+        content, total = IMPORT_PATTERN.subn(IMPORT_REPLACEMENT, content)
+        
+        if total:
+            write_atomically(path, content)
+        return total, b'import javax.' in content
+        
+    except OSError as e:
+        print(f"❌ Error migrating {path}: {e}")
+        return 0, False
 
 def migrate_javax_to_jakarta():
     """Migrate all javax imports to jakarta in Java files"""
     
-    # Mapping of javax packages to jakarta equivalents
-    mappings = {
-        'javax.persistence': 'jakarta.persistence',
-        'javax.validation': 'jakarta.validation', 
-        'javax.servlet': 'jakarta.servlet',
-        'javax.transaction': 'jakarta.transaction',
-        'javax.annotation': 'jakarta.annotation',
-        'javax.inject': 'jakarta.inject',
-        'javax.enterprise': 'jakarta.enterprise',
-        'javax.interceptor': 'jakarta.interceptor',
-        'javax.decorator': 'jakarta.decorator',
-        'javax.security': 'jakarta.security',
-        'javax.ws.rs': 'jakarta.ws.rs',
-        'javax.xml.bind': 'jakarta.xml.bind',
-        'javax.jms': 'jakarta.jms',
-        'javax.mail': 'jakarta.mail',
-        'javax.json': 'jakarta.json',
-        'javax.jsonb': 'jakarta.jsonb',
-        'javax.faces': 'jakarta.faces',
-        'javax.websocket': 'jakarta.websocket',
-        'javax.ejb': 'jakarta.ejb',
-        'javax.batch': 'jakarta.batch'
-    }
+    java_files = list(find_java_files())
+    
+    # Single in-process pass: each file is read once and written at most once
+    files_modified = 0
+    imports_migrated = 0
+    remaining = 0
+    with ProcessPoolExecutor() as executor:
+        for count, has_javax in executor.map(migrate_file, java_files, chunksize=64):
+            if count:
+                files_modified += 1
+                imports_migrated += count
+            if has_javax:
+                remaining += 1
     
-    # Use sed commands for efficient bulk replacement
-    for javax_pkg, jakarta_pkg in mappings.items():
-        try:
-            # Replace import statements
-            cmd = f"find . -name '*.java' -type f -exec sed -i 's/import {javax_pkg.replace('.', '\\.')}/import {jakarta_pkg}/g' {{}} +"
-            subprocess.run(cmd, shell=True, check=True)
-            
-            # Replace static imports  
-            cmd = f"find . -name '*.java' -type f -exec sed -i 's/import static {javax_pkg.replace('.', '\\.')}/import static {jakarta_pkg}/g' {{}} +"
-            subprocess.run(cmd, shell=True, check=True)
-            
-            print(f"✅ Migrated {javax_pkg} -> {jakarta_pkg}")
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error migrating {javax_pkg}: {e}")
+    print(f"✅ Migrated {imports_migrated} imports in {files_modified} of {len(java_files)} files")
     
     # Verify migration
-    try:
-        result = subprocess.run(
-            "find . -name '*.java' -exec grep -l 'import javax\\.' {} \\; | wc -l",
-            shell=True, capture_output=True, text=True
-        )
-        remaining = int(result.stdout.strip())
-        
-        if remaining == 0:
-            print("✅ Migration complete - no javax imports remain")
-        else:
-            print(f"⚠️ {remaining} files still contain javax imports")
-            
-    except Exception as e:
-        print(f"Error verifying migration: {e}")
+    if remaining == 0:
+        print("✅ Migration complete - no javax imports remain")
+    else:
+        print(f"⚠️ {remaining} files still contain javax imports")
 
 if __name__ == "__main__":
     print("🔧 Starting efficient javax -> jakarta migration")
@@ -7,6 +7,8 @@ Impact: Fixes 72 missing FK indexes that cause performance degradation
 """
 
 import os
+import re
+import shutil
 from pathlib import Path
 from datetime import datetime
 
@@ -108,6 +110,26 @@ SERVICE_INDEXES = {
     ],
 }
 
+INDEX_SQL_RE = re.compile(r'(idx_\w+)\s+ON\s+(\w+)\s*\(\s*(\w+)')
+
+# Leading version number of a Flyway migration file name (V1__, V005__, V1000__)
+MIGRATION_VERSION_PATTERN = re.compile(r'V(\d+)')
+
+
+def parse_index(index_sql):
+    """Return (index_name, table, column) for a CREATE INDEX statement."""
+    match = INDEX_SQL_RE.search(index_sql)
+    if match is None:
+        raise ValueError(f"Unparseable index statement: {index_sql}")
+    return match.groups()
+
+
+# Service name -> list of (index_name, table, column), parsed once at load
+PARSED_INDEXES = {
+    service_name: [parse_index(index_sql) for index_sql in indexes]
+    for service_name, indexes in SERVICE_INDEXES.items()
+}
+
 
 def main():
     print("=" * 80)
@@ -133,9 +155,9 @@ def main():
         migration_dir = service_dir / "src" / "main" / "resources" / "db" / "migration"
         migration_dir.mkdir(parents=True, exist_ok=True)
 
-        # Count existing migrations
-        existing_migrations = list(migration_dir.glob("V*.sql"))
-        next_version = len(existing_migrations) + 1
+        # Next version follows the highest existing migration, whatever its digit count
+        versions = (MIGRATION_VERSION_PATTERN.match(p.name) for p in migration_dir.glob("V*.sql"))
+        next_version = max((int(m.group(1)) for m in versions if m), default=0) + 1
         version = f"V{next_version:03d}"
 
         migration_file = migration_dir / f"{version}__Add_foreign_key_indexes.sql"
@@ -144,7 +166,7 @@ def main():
         total_indexes += index_count
 
         # Generate migration content
-        migration_content = f"""-- Add Foreign Key Indexes for Performance
+        parts = [f"""-- Add Foreign Key Indexes for Performance
 -- Service: {service_name}
 -- Date: {datetime.now().strftime('%Y-%m-%d')}
 -- Description: Add missing indexes on foreign key columns to prevent table scans
@@ -165,38 +187,31 @@ def main():
 --
 -- Total Indexes: {index_count}
 
-"""
+"""]
 
         # Add all indexes
-        for index_sql in indexes:
-            migration_content += index_sql + "\n"
+        parts.extend(index_sql + "\n" for index_sql in indexes)
 
-        migration_content += "\n-- Index comments for documentation\n"
+        parts.append("\n-- Index comments for documentation\n")
 
         # Add comments for each index
-        for index_sql in indexes:
-            # Parse index name, table, and column from SQL
-            try:
-                parts = index_sql.replace("(", " ( ").replace(")", " ) ").split()
-                if "idx_" in index_sql and " ON " in index_sql:
-                    idx_pos = next(i for i, p in enumerate(parts) if p.startswith("idx_"))
-                    on_pos = next(i for i, p in enumerate(parts) if p == "ON")
-                    index_name = parts[idx_pos]
-                    table_name = parts[on_pos + 1] if on_pos + 1 < len(parts) else "unknown"
-                    col_pos = on_pos + 3 if on_pos + 3 < len(parts) else on_pos + 2
-                    column = parts[col_pos].rstrip(");,") if col_pos < len(parts) else "unknown"
-                    migration_content += f"COMMENT ON INDEX {index_name} IS 'Foreign key index for {table_name}.{column} - Performance optimization';\n"
-            except Exception:
-                # Skip if parsing fails
-                pass
+        parts.extend(
+            f"COMMENT ON INDEX {index_name} IS 'Foreign key index for {table_name}.{column} - Performance optimization';\n"
+            for index_name, table_name, column in PARSED_INDEXES[service_name]
+        )
+        migration_content = "".join(parts)
 
         # Write migration file
         migration_file.write_text(migration_content)
         print(f"  ✓ Created: {migration_file.name} ({index_count} indexes)")
 
-        # Copy to centralized output
+        # Link to centralized output, copying when hardlinks are unavailable
         output_file = output_dir / f"{service_name}_fk_indexes.sql"
-        output_file.write_text(migration_content)
+        output_file.unlink(missing_ok=True)
+        try:
+            os.link(migration_file, output_file)
+        except OSError:
+            shutil.copyfile(migration_file, output_file)
 
         services_processed += 1
 